@@ -0,0 +1,85 @@
+"""Pure math helpers for the unit circle app.
+
+They live outside app.py because Streamlit re-executes the main script on
+every rerun; module-level state here (such as the lru_cache) persists
+across reruns.
+"""
+import math
+import functools
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the *_jit helpers below are plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+AXIS_LABELS = {
+    0: "Positive X-axis",
+    90: "Positive Y-axis",
+    180: "Negative X-axis",
+    270: "Negative Y-axis",
+    360: "Positive X-axis",
+}
+QUADRANT_LABELS = ("Quadrant I", "Quadrant II", "Quadrant III", "Quadrant IV")
+
+def _quadrant_code(angle):
+    """Returns 0-3 for Quadrants I-IV, or -1 for angles on an axis."""
+    if angle % 90 == 0:
+        return -1
+    return (angle - 1) // 90
+
+def _reference_angle(angle):
+    """Returns the reference angle, or -1 for angles on an axis."""
+    if angle % 90 == 0:
+        return -1
+    ref = angle % 180
+    return 180 - ref if ref > 90 else ref
+
+# Compiled variants for batch callers (e.g. labelling all 361 angles at once);
+# a single call per rerun is faster through the plain-Python versions above
+_quadrant_code_jit = njit(cache=True)(_quadrant_code)
+_reference_angle_jit = njit(cache=True)(_reference_angle)
+
+def get_quadrant(angle):
+    """Determines the quadrant of a given angle in degrees."""
+    code = _quadrant_code(angle)
+    return AXIS_LABELS[angle] if code < 0 else QUADRANT_LABELS[code]
+
+def get_reference_angle(angle):
+    """Calculates the reference angle for a given angle in degrees."""
+    ref = _reference_angle(angle)
+    return None if ref < 0 else ref # No reference angle for axes
+
+# Exact (cos, sin) of the key angles, correctly rounded to double precision
+KEY_XY = {
+    0: (1.0, 0.0),
+    30: (0.8660254037844386, 0.5),
+    45: (0.7071067811865476, 0.7071067811865476),
+    60: (0.5, 0.8660254037844386),
+    90: (0.0, 1.0),
+    120: (-0.5, 0.8660254037844386),
+    135: (-0.7071067811865476, 0.7071067811865476),
+    150: (-0.8660254037844386, 0.5),
+    180: (-1.0, 0.0),
+    210: (-0.8660254037844386, -0.5),
+    225: (-0.7071067811865476, -0.7071067811865476),
+    240: (-0.5, -0.8660254037844386),
+    270: (0.0, -1.0),
+    300: (0.5, -0.8660254037844386),
+    315: (0.7071067811865476, -0.7071067811865476),
+    330: (0.8660254037844386, -0.5),
+}
+
+@functools.lru_cache(maxsize=512)
+def trig_values(angle):
+    """Returns (cos, sin, tan) for an angle in degrees; tan is None where undefined."""
+    if angle % 360 in KEY_XY:
+        cos_val, sin_val = KEY_XY[angle % 360]
+    else:
+        rad = math.radians(angle)
+        cos_val, sin_val = math.cos(rad), math.sin(rad)
+    # tan reuses sin/cos and is undefined exactly at 90 and 270 degrees
+    return cos_val, sin_val, (None if angle % 180 == 90 else sin_val / cos_val)